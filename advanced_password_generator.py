@@ -9,143 +9,424 @@
 # Requires: Python 3.8+ (Tkinter included on most installs)
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+import bisect
+import collections
+import functools
 import string
+import struct
 import secrets
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; the pure-Python scan below handles everything.
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional too; without it the exec-specialized pure-Python
+    # generator below is used instead of the compiled kernel.
+    njit = None
+
 # --- Password generation logic -------------------------------------------------
 
-LOOKALIKE_CHARS = set('O0l1I|S5B8Z2G6q9')
+LOOKALIKE_CHARS = frozenset('O0l1I|S5B8Z2G6q9')
+
+# A conservative, widely accepted symbol set
+_SYMBOL_CHARS = '!@#$%^&*()-_=+[]{};:,.?/`~|\\'
+
+# Each fixed alphabet as a 256-entry membership mask (1 = char code belongs),
+# built once at import. Exclusions then become byte-wise mask arithmetic
+# instead of Python set differences.
+def _make_mask(chars):
+    mask = bytearray(256)
+    for c in chars.encode('latin1'):
+        mask[c] = 1
+    return bytes(mask)
+
+_LOWER_MASK = _make_mask(string.ascii_lowercase)
+_UPPER_MASK = _make_mask(string.ascii_uppercase)
+_DIGIT_MASK = _make_mask(string.digits)
+_SYMBOL_MASK = _make_mask(_SYMBOL_CHARS)
 
+@functools.lru_cache(maxsize=32)
 def build_charsets(use_lower=True, use_upper=True, use_digits=True, use_symbols=True,
                    exclude_lookalikes=False, exclude_custom=""):
-    sets = []
+    """Return (set_bytes, pool_bytes, pool_size) for the given options.
+
+    set_bytes is a tuple of bytes objects (the allowed characters of each
+    selected category), pool_bytes their sorted union, pool_size its length.
+    Everything is pre-materialized in the form the generator consumes, and
+    cached so repeated Generate clicks with unchanged settings cost a single
+    dict lookup."""
+    masks = []
     if use_lower:
-        sets.append(set(string.ascii_lowercase))
+        masks.append(_LOWER_MASK)
     if use_upper:
-        sets.append(set(string.ascii_uppercase))
+        masks.append(_UPPER_MASK)
     if use_digits:
-        sets.append(set(string.digits))
+        masks.append(_DIGIT_MASK)
     if use_symbols:
-        # A conservative, widely accepted symbol set
-        sets.append(set('!@#$%^&*()-_=+[]{};:,.?/`~|\\'))
+        masks.append(_SYMBOL_MASK)
 
-    if not sets:
+    if not masks:
         raise ValueError("Select at least one character type.")
 
-    # Apply exclusions
-    exclude = set(exclude_custom)
+    # Apply exclusions by zeroing the corresponding byte in a keep-mask
+    keep = bytearray(b'\x01' * 256)
+    for c in exclude_custom:
+        if ord(c) < 256:
+            keep[ord(c)] = 0
     if exclude_lookalikes:
-        exclude |= LOOKALIKE_CHARS
-
-    sets = [s - exclude for s in sets]
-    # Remove any emptied sets (e.g., user excluded everything in a category)
-    sets = [s for s in sets if s]
-    if not sets:
+        for c in LOOKALIKE_CHARS:
+            keep[ord(c)] = 0
+
+    # AND each category with the keep-mask; OR the survivors into the pool.
+    # Drop any emptied category (e.g., user excluded everything in it).
+    allowed = bytearray(256)
+    set_bytes = []
+    for mask in masks:
+        category = bytes(m & k for m, k in zip(mask, keep))
+        if any(category):
+            set_bytes.append(bytes(i for i in range(256) if category[i]))
+            for i, bit in enumerate(category):
+                allowed[i] |= bit
+    if not set_bytes:
         raise ValueError("Chosen exclusions removed all characters. Loosen your settings.")
-    return sets
+    pool_bytes = bytes(i for i in range(256) if allowed[i])
+    return tuple(set_bytes), pool_bytes, len(pool_bytes)
+
+# 256-entry tables mapping a character code to its alphabet position
+# (0-25 for a-z/A-Z, 0-9 for digits), with 255 marking "not in the alphabet".
+# Built once at import so has_sequence does plain byte indexing, no dicts.
+def _make_index_table(*alphabets):
+    table = bytearray(b'\xff' * 256)
+    for alphabet in alphabets:
+        for i, c in enumerate(alphabet.encode('ascii')):
+            table[c] = i
+    return bytes(table)
+
+_ALPHA_IDX = _make_index_table(string.ascii_lowercase, string.ascii_uppercase)
+_DIGIT_IDX = _make_index_table(string.digits)
+
+if np is not None:
+    # int16 copies of the tables with a -128 sentinel, so np.diff never
+    # produces +/-1 across a non-alphabet byte.
+    _ALPHA_LUT = np.frombuffer(_ALPHA_IDX, dtype=np.uint8).astype(np.int16)
+    _ALPHA_LUT[_ALPHA_LUT == 255] = -128
+    _DIGIT_LUT = np.frombuffer(_DIGIT_IDX, dtype=np.uint8).astype(np.int16)
+    _DIGIT_LUT[_DIGIT_LUT == 255] = -128
+
+# Every forbidden 3-byte window, enumerated once at import: each length-3
+# run of the letter and digit alphabets, both directions, and for letters
+# every case combination (matching the old lowercased comparison). Roughly
+# 400 entries, so the scan is one set lookup per window.
+def _forbidden_triples():
+    triples = set()
+    for run in (string.ascii_lowercase, string.digits):
+        for i in range(len(run) - 2):
+            for w in (run[i:i+3], run[i:i+3][::-1]):
+                if w.isdigit():
+                    triples.add(w.encode('ascii'))
+                    continue
+                for a in (w[0], w[0].upper()):
+                    for b in (w[1], w[1].upper()):
+                        for c in (w[2], w[2].upper()):
+                            triples.add((a + b + c).encode('ascii'))
+    return frozenset(triples)
+
+_FORBIDDEN = _forbidden_triples()
+
+# Below this length the numpy call overhead outweighs the vectorized scan.
+_VECTOR_MIN_LEN = 32
+
+def _has_sequence_vector(b):
+    arr = np.frombuffer(b, dtype=np.uint8)
+    for lut in (_ALPHA_LUT, _DIGIT_LUT):
+        d = np.diff(lut[arr])
+        hit = ((d[:-1] == 1) & (d[1:] == 1)) | ((d[:-1] == -1) & (d[1:] == -1))
+        if hit.any():
+            return True
+    return False
 
 def has_sequence(s):
     """Return True if s contains an ascending or descending sequence of length >= 3
-    for alphabetic or numeric runs (e.g., abc, 123, CBA, 987)."""
+    for alphabetic or numeric runs (e.g., abc, 123, CBA, 987).
+
+    Letter matching is case-insensitive (aBc counts) without lowercasing a
+    copy of s: the index tables map both cases to the same position and the
+    forbidden-triple set enumerates every case combination."""
     if len(s) < 3:
         return False
-    # Normalize for alpha checks
-    alpha = string.ascii_lowercase
-    digits = string.digits
-
-    # Build a quick lookup for positions
-    pos_alpha = {c:i for i,c in enumerate(alpha)}
-    pos_digits = {c:i for i,c in enumerate(digits)}
-
-    sl = s.lower()
-    for i in range(len(s)-2):
-        a,b,c = sl[i], sl[i+1], sl[i+2]
-        # alpha sequences
-        if a in pos_alpha and b in pos_alpha and c in pos_alpha:
-            if pos_alpha[b]-pos_alpha[a]==1 and pos_alpha[c]-pos_alpha[b]==1:
-                return True
-            if pos_alpha[b]-pos_alpha[a]==-1 and pos_alpha[c]-pos_alpha[b]==-1:
-                return True
-        # digit sequences
-        if s[i] in pos_digits and s[i+1] in pos_digits and s[i+2] in pos_digits:
-            if pos_digits[s[i+1]]-pos_digits[s[i]]==1 and pos_digits[s[i+2]]-pos_digits[s[i+1]]==1:
-                return True
-            if pos_digits[s[i+1]]-pos_digits[s[i]]==-1 and pos_digits[s[i+2]]-pos_digits[s[i+1]]==-1:
-                return True
-    return False
+    b = s.encode('latin1')
+    if np is not None and len(b) >= _VECTOR_MIN_LEN:
+        return _has_sequence_vector(b)
+    return any(b[i:i+3] in _FORBIDDEN for i in range(len(b) - 2))
 
-def generate_password(length, use_lower, use_upper, use_digits, use_symbols,
-                      exclude_lookalikes, exclude_custom, avoid_repeats, avoid_sequences):
+# One SystemRandom for the whole module; instantiating it per call only
+# added allocation churn, it carries no state worth isolating.
+_RNG = secrets.SystemRandom()
+
+# Bytes of CSPRNG output pulled per refill; 128 16-bit draws per syscall
+# instead of one os.urandom round-trip per character.
+_RAND_BLOCK = 256
+
+def _random_uint16s():
+    """Yield uniformly random 16-bit integers from block reads of the OS CSPRNG."""
+    while True:
+        buf = secrets.token_bytes(_RAND_BLOCK)
+        for (value,) in struct.iter_unpack('<H', buf):
+            yield value
+
+def _rand_below(bound, randbits):
+    """Return a uniform index in [0, bound) by masked rejection sampling."""
+    mask = (1 << (bound - 1).bit_length()) - 1
+    while True:
+        idx = next(randbits) & mask
+        if idx < bound:
+            return idx
+
+# Specialized generator functions keyed by (pool, categories, rule flags).
+# The option flags rarely change within a session, so each combination is
+# compiled once and every later click reuses the cached function.
+_SPECIALIZED = {}
+
+def _specialize(pool_bytes, set_bytes, strict_no_duplicates, no_adjacent_repeat,
+                avoid_sequences):
+    """Compile a generator specialized for one settings combination.
+
+    The pool, the per-category byte strings and the helpers are bound as
+    default arguments (so they resolve as locals), and the avoid_repeats /
+    avoid_sequences branches are statically included or dropped -- the
+    per-character loop carries no option checks at all."""
+    lines = [
+        "def _gen(length, rng, randbits,",
+        "         _pool=pool_bytes, _sets=set_bytes,",
+        "         _rand_below=_rand_below, _has_sequence=has_sequence):",
+        # Guarantee at least one from each selected set. The picks are drawn
+        # once and kept across retries: the shuffle already removes any
+        # position bias, so only the fill needs redoing on a reset.
+        "    mandatory = bytes(rng.choice(t) for t in _sets)",
+        "    password_chars = bytearray(mandatory)",
+    ]
+    if strict_no_duplicates:
+        lines.append("    used = set(mandatory)")
+    lines += [
+        "    attempts = 0",
+        "    while True:",
+        "        attempts += 1",
+        "        if attempts > 500:",
+        "            raise RuntimeError('Could not satisfy constraints. Try relaxing options.')",
+        "        while len(password_chars) < length:",
+        "            ch = _pool[_rand_below(%d, randbits)]" % len(pool_bytes),
+    ]
+    if strict_no_duplicates:
+        lines += [
+            "            if ch in used:",
+            "                continue",
+        ]
+    if no_adjacent_repeat:
+        lines += [
+            "            if password_chars and ch == password_chars[-1]:",
+            "                continue",
+        ]
+    lines.append("            password_chars.append(ch)")
+    if strict_no_duplicates:
+        lines.append("            used.add(ch)")
+    lines += [
+        # Fisher-Yates shuffle to break predictability of the mandatory picks
+        "        for i in range(length - 1, 0, -1):",
+        "            j = _rand_below(i + 1, randbits)",
+        "            password_chars[i], password_chars[j] = password_chars[j], password_chars[i]",
+        "        candidate = password_chars.decode('latin1')",
+    ]
+    if avoid_sequences:
+        lines += [
+            "        if _has_sequence(candidate):",
+            "            password_chars[:] = mandatory",
+        ]
+        if strict_no_duplicates:
+            lines.append("            used = set(mandatory)")
+        lines.append("            continue")
+    lines.append("        return candidate")
+
+    namespace = {
+        'pool_bytes': pool_bytes,
+        'set_bytes': set_bytes,
+        '_rand_below': _rand_below,
+        'has_sequence': has_sequence,
+    }
+    exec('\n'.join(lines), namespace)
+    return namespace['_gen']
+
+if njit is not None:
+    @njit(cache=True)
+    def _generate_kernel(length, pool, mandatory, alpha_lut, digit_lut,
+                         strict_no_duplicates, no_adjacent_repeat, avoid_sequences,
+                         rand_words, out):
+        """Fill + shuffle + sequence-check in one compiled pass over bytes.
+
+        Consumes randomness from rand_words (16-bit values drawn outside the
+        kernel so the CSPRNG source is unchanged). Returns 0 on success, -1
+        when rand_words ran out mid-attempt, 1 when the attempt cap is hit."""
+        pool_size = pool.shape[0]
+        pmask = 1
+        while pmask < pool_size:
+            pmask <<= 1
+        pmask -= 1
+        nrand = rand_words.shape[0]
+        n_mand = mandatory.shape[0]
+        rpos = 0
+        seen = np.zeros(256, dtype=np.uint8)
+        for _attempt in range(500):
+            for i in range(n_mand):
+                out[i] = mandatory[i]
+            if strict_no_duplicates:
+                for i in range(256):
+                    seen[i] = 0
+                for i in range(n_mand):
+                    seen[mandatory[i]] = 1
+            n = n_mand
+            while n < length:
+                if rpos >= nrand:
+                    return -1
+                idx = rand_words[rpos] & pmask
+                rpos += 1
+                if idx >= pool_size:
+                    continue
+                ch = pool[idx]
+                if strict_no_duplicates and seen[ch] == 1:
+                    continue
+                if no_adjacent_repeat and n > 0 and out[n - 1] == ch:
+                    continue
+                out[n] = ch
+                seen[ch] = 1
+                n += 1
+            # Fisher-Yates shuffle, same masked rejection sampling
+            for i in range(length - 1, 0, -1):
+                bound = i + 1
+                smask = 1
+                while smask < bound:
+                    smask <<= 1
+                smask -= 1
+                while True:
+                    if rpos >= nrand:
+                        return -1
+                    j = rand_words[rpos] & smask
+                    rpos += 1
+                    if j < bound:
+                        break
+                tmp = out[i]
+                out[i] = out[j]
+                out[j] = tmp
+            if not avoid_sequences:
+                return 0
+            ok = True
+            for i in range(length - 2):
+                a = alpha_lut[out[i]]
+                b = alpha_lut[out[i + 1]]
+                c = alpha_lut[out[i + 2]]
+                if b - a == c - b and (b - a == 1 or b - a == -1):
+                    ok = False
+                    break
+                a = digit_lut[out[i]]
+                b = digit_lut[out[i + 1]]
+                c = digit_lut[out[i + 2]]
+                if b - a == c - b and (b - a == 1 or b - a == -1):
+                    ok = False
+                    break
+            if ok:
+                return 0
+        return 1
+
+    def _generate_jit(length, pool_bytes, set_bytes, strict_no_duplicates,
+                      no_adjacent_repeat, avoid_sequences, rng):
+        pool = np.frombuffer(pool_bytes, dtype=np.uint8)
+        mandatory = np.frombuffer(bytes(rng.choice(t) for t in set_bytes),
+                                  dtype=np.uint8)
+        out = np.empty(length, dtype=np.uint8)
+        words = max(length * 8, 256)
+        while True:
+            rand_words = np.frombuffer(secrets.token_bytes(words * 2), dtype=np.uint16)
+            status = _generate_kernel(length, pool, mandatory, _ALPHA_LUT, _DIGIT_LUT,
+                                      strict_no_duplicates, no_adjacent_repeat,
+                                      avoid_sequences, rand_words, out)
+            if status == 0:
+                return out.tobytes().decode('latin1')
+            if status > 0:
+                raise RuntimeError("Could not satisfy constraints. Try relaxing options.")
+            # Ran out of randomness mid-attempt; retry with a bigger block
+            words *= 2
+
+# Everything the generator needs for one settings combination, derived once
+_Prep = collections.namedtuple('_Prep', ['set_bytes', 'pool_bytes', 'pool_size',
+                                         'strict_no_duplicates', 'no_adjacent_repeat',
+                                         'avoid_sequences', 'gen'])
+
+@functools.lru_cache(maxsize=32)
+def _prepare(length, use_lower, use_upper, use_digits, use_symbols,
+             exclude_lookalikes, exclude_custom, avoid_repeats, avoid_sequences):
+    """Derive the full settings bundle: charset bytes, rule flags and the
+    specialized generator. Cached, so a repeat click with unchanged options
+    reduces all preparatory work to one dict lookup."""
     if length < 4:
         raise ValueError("Length should be at least 4.")
 
-    sets = build_charsets(use_lower, use_upper, use_digits, use_symbols,
-                          exclude_lookalikes, exclude_custom)
-    rng = secrets.SystemRandom()
+    set_bytes, pool_bytes, pool_size = build_charsets(use_lower, use_upper, use_digits,
+                                                      use_symbols, exclude_lookalikes,
+                                                      exclude_custom)
 
-    # Guarantee at least one from each selected set
-    password_chars = [rng.choice(tuple(s)) for s in sets]
+    # If avoid_repeats is strict (no duplicates) but impossible for this
+    # length, fall back to the looser no-adjacent-repeat rule
+    strict_no_duplicates = bool(avoid_repeats) and length <= pool_size
+    no_adjacent_repeat = bool(avoid_repeats) and not strict_no_duplicates
 
-    # Build pool
-    pool = set().union(*sets)
-    if not pool:
-        raise ValueError("Character pool is empty after exclusions.")
-    pool = list(pool)
+    gen = None
+    if njit is None:
+        key = (pool_bytes, set_bytes, strict_no_duplicates, no_adjacent_repeat,
+               bool(avoid_sequences))
+        gen = _SPECIALIZED.get(key)
+        if gen is None:
+            gen = _SPECIALIZED[key] = _specialize(*key)
 
-    # If avoid_repeats is strict (no duplicates), ensure it's possible
-    if avoid_repeats and length > len(pool):
-        # Fall back to no-adjacent-repeat only
-        strict_no_duplicates = False
-    else:
-        strict_no_duplicates = True if avoid_repeats else False
+    return _Prep(set_bytes, pool_bytes, pool_size, strict_no_duplicates,
+                 no_adjacent_repeat, bool(avoid_sequences), gen)
 
-    attempts = 0
-    while True:
-        attempts += 1
-        if attempts > 500:
-            raise RuntimeError("Could not satisfy constraints. Try relaxing options.")
-
-        # Fill remaining positions
-        while len(password_chars) < length:
-            ch = rng.choice(pool)
-            if avoid_repeats:
-                if strict_no_duplicates and ch in password_chars:
-                    continue
-                if not strict_no_duplicates and password_chars and ch == password_chars[-1]:
-                    continue
-            password_chars.append(ch)
-
-        # Shuffle to break predictability of mandatory picks
-        rng.shuffle(password_chars)
-        candidate = ''.join(password_chars)
-
-        # Apply sequence rule
-        if avoid_sequences and has_sequence(candidate):
-            # reset and try again
-            password_chars = [rng.choice(tuple(s)) for s in sets]
-            continue
-
-        return candidate
-
-def estimate_entropy(pw, use_lower, use_upper, use_digits, use_symbols, exclude_lookalikes, exclude_custom):
-    # Estimate pool size similar to what user selected/excluded
-    sets = build_charsets(use_lower, use_upper, use_digits, use_symbols, exclude_lookalikes, exclude_custom)
-    pool = set().union(*sets)
-    pool_size = max(len(pool), 1)
-    entropy_bits = len(pw) * math.log2(pool_size)
+def generate_password(length, use_lower, use_upper, use_digits, use_symbols,
+                      exclude_lookalikes, exclude_custom, avoid_repeats, avoid_sequences):
+    p = _prepare(length, use_lower, use_upper, use_digits, use_symbols,
+                 exclude_lookalikes, exclude_custom, avoid_repeats, avoid_sequences)
+
+    if njit is not None:
+        candidate = _generate_jit(length, p.pool_bytes, p.set_bytes,
+                                  p.strict_no_duplicates, p.no_adjacent_repeat,
+                                  p.avoid_sequences, _RNG)
+    else:
+        candidate = p.gen(length, _RNG, _random_uint16s())
+    # Hand back the pool size too so the caller can estimate entropy
+    # without recomputing the charsets.
+    return candidate, p.pool_size
+
+# log2 for every reachable pool size (the full alphabet is 90 characters),
+# so estimate_entropy is a table index instead of a libm call
+_LOG2 = [0.0] + [math.log2(i) for i in range(1, 129)]
+
+def estimate_entropy(pw, pool_size):
+    # Pool size comes straight from generate_password; no need to rebuild
+    # the charsets a second time per click.
+    pool_size = max(pool_size, 1)
+    entropy_bits = len(pw) * (_LOG2[pool_size] if pool_size < len(_LOG2)
+                              else math.log2(pool_size))
     return entropy_bits, pool_size
 
+_STRENGTH_THRESHOLDS = (45, 60, 80)
+_STRENGTH_LABELS = ("Weak", "Moderate", "Strong", "Very strong")
+
 def strength_label(entropy_bits):
-    if entropy_bits < 45:
-        return "Weak"
-    elif entropy_bits < 60:
-        return "Moderate"
-    elif entropy_bits < 80:
-        return "Strong"
-    else:
-        return "Very strong"
+    return _STRENGTH_LABELS[bisect.bisect_right(_STRENGTH_THRESHOLDS, entropy_bits)]
 
 # --- GUI ----------------------------------------------------------------------
 
@@ -170,6 +451,10 @@ class App(ttk.Frame):
         # Layout
         self.build_ui()
 
+        # Prime the settings cache for the defaults once the UI is idle, so
+        # the first Generate click is no slower than the rest
+        self.after_idle(self._warm_cache)
+
     def build_ui(self):
         # Length
         lf = ttk.LabelFrame(self, text="Length")
@@ -218,6 +503,17 @@ class App(ttk.Frame):
         self.progress = ttk.Progressbar(sf, length=260, mode="determinate", maximum=100)
         self.progress.grid(row=0, column=2, sticky="e", padx=(12,0))
 
+        # Inline status line: errors and notifications land here instead of
+        # modal messageboxes, which block the mainloop on every popup
+        self.status = ttk.Label(of, text="")
+        self.status.grid(row=3, column=0, sticky="w", padx=8, pady=(0,6))
+
+    def _warm_cache(self):
+        try:
+            _prepare(**{name: getattr(self, name).get() for name in self._OPTION_VARS})
+        except ValueError:
+            pass
+
     def _clamp_length(self):
         try:
             v = int(self.length.get())
@@ -230,45 +526,41 @@ class App(ttk.Frame):
         # Make sure spinbox reflects the slider (already bound via variable)
         self._clamp_length()
 
+    # Tk variables read by on_generate, in generate_password argument order
+    _OPTION_VARS = ('length', 'use_lower', 'use_upper', 'use_digits', 'use_symbols',
+                    'exclude_lookalikes', 'exclude_custom', 'avoid_repeats',
+                    'avoid_sequences')
+
     def on_generate(self):
         self._clamp_length()
+        # Snapshot every Tk variable once up front: each .get() is a Tcl
+        # round-trip, so keep them out of the generation hot path.
+        opts = {name: getattr(self, name).get() for name in self._OPTION_VARS}
         try:
-            pw = generate_password(
-                length=self.length.get(),
-                use_lower=self.use_lower.get(),
-                use_upper=self.use_upper.get(),
-                use_digits=self.use_digits.get(),
-                use_symbols=self.use_symbols.get(),
-                exclude_lookalikes=self.exclude_lookalikes.get(),
-                exclude_custom=self.exclude_custom.get(),
-                avoid_repeats=self.avoid_repeats.get(),
-                avoid_sequences=self.avoid_sequences.get()
-            )
+            pw, pool_size = generate_password(**opts)
             self.output.delete(0, tk.END)
             self.output.insert(0, pw)
-            bits, pool_size = estimate_entropy(
-                pw,
-                self.use_lower.get(), self.use_upper.get(), self.use_digits.get(), self.use_symbols.get(),
-                self.exclude_lookalikes.get(), self.exclude_custom.get()
-            )
+            bits, pool_size = estimate_entropy(pw, pool_size)
             label = f"{strength_label(bits)}  (~{bits:.1f} bits; pool={pool_size})"
             self.str_label.config(text=label)
             # Map bits to 0..100 (cap at 100)
             score = max(0, min(100, int(bits)))
             self.progress['value'] = score
+            self.status.config(text="")
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self.status.config(text=str(e), foreground="red")
 
     def on_copy(self):
         pw = self.output.get()
         if not pw:
-            messagebox.showwarning("Nothing to copy", "Generate a password first.")
+            self.status.config(text="Nothing to copy - generate a password first.",
+                               foreground="red")
             return
         self.clipboard_clear()
         self.clipboard_append(pw)
         # Keep clipboard after app closes
         self.update()  # ensures the clipboard data is set
-        messagebox.showinfo("Copied", "Password copied to clipboard.")
+        self.status.config(text="Password copied to clipboard.", foreground="green")
 
 
 def main():